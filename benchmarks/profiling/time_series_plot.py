@@ -1,32 +1,32 @@
 import datetime as dt
 
 import finam as fm
+import matplotlib
+import matplotlib.pyplot as plt
 
 from finam_plot import TimeSeriesPlot
 
+# Render headless, so that profiles are not dominated by the GUI event loop
+matplotlib.use("Agg")
+
+INFO = fm.Info(time=None, grid=fm.NoGrid(), units="m")
+DATA = [
+    fm.data.full(0.0, "input", INFO),
+    fm.data.full(1.0, "input", INFO),
+]
+
 
 def run_model():
     start_time = dt.datetime(2000, 1, 1)
     end_time = dt.datetime(2000, 3, 31)
 
-    counter = 0
-
-    info1 = fm.Info(time=None, grid=fm.NoGrid(), units="m")
-    data = [
-        fm.data.full(0.0, "input", info1),
-        fm.data.full(1.0, "input", info1),
-    ]
-
     def gen_data(t):
-        nonlocal counter
-        d = data[(counter // 2) % 2]
-        counter += 1
-        return d
+        return DATA[(t - start_time).days % 2]
 
     source = fm.modules.CallbackGenerator(
         callbacks={
-            "Out1": (gen_data, info1.copy()),
-            "Out2": (gen_data, info1.copy()),
+            "Out1": (gen_data, INFO.copy()),
+            "Out2": (gen_data, INFO.copy()),
         },
         start=start_time,
         step=dt.timedelta(days=1),
@@ -41,6 +41,8 @@ def run_model():
 
     composition.run(end_time=end_time)
 
+    plt.close("all")
+
 
 if __name__ == "__main__":
     for i in range(1):
@@ -7,8 +7,9 @@ import numpy as np
 from finam_plot import ColorMeshPlot
 
 if __name__ == "__main__":
-    x = np.linspace(0, 29, 30) + np.random.uniform(-0.4, 0.4, (30,))
-    y = np.linspace(0, 19, 20) + np.random.uniform(-0.4, 0.4, (20,))
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 29, 30) + rng.uniform(-0.4, 0.4, (30,))
+    y = np.linspace(0, 19, 20) + rng.uniform(-0.4, 0.4, (20,))
     grid = fm.RectilinearGrid([x, y], order="C")
 
     source = fm.modules.SimplexNoise(
@@ -18,11 +18,17 @@ if __name__ == "__main__":
         ),
         units="m",
     )
-    grid_1 = (
-        np.zeros(shape=info_1.grid.data_shape, order=info_1.grid.order) * fm.UNITS.meter
+    grid_1 = fm.UNITS.Quantity(
+        np.zeros(
+            shape=info_1.grid.data_shape, order=info_1.grid.order, dtype=np.float32
+        ),
+        fm.UNITS.meter,
     )
-    grid_2 = (
-        np.zeros(shape=info_2.grid.data_shape, order=info_2.grid.order) * fm.UNITS.meter
+    grid_2 = fm.UNITS.Quantity(
+        np.zeros(
+            shape=info_2.grid.data_shape, order=info_2.grid.order, dtype=np.float32
+        ),
+        fm.UNITS.meter,
     )
     source = fm.modules.CallbackGenerator(
         callbacks={
@@ -11,7 +11,7 @@ if __name__ == "__main__":
 
     px = np.random.uniform(0, 20, 500)
     py = np.random.uniform(0, 16, 500)
-    unstructured_grid = fm.UnstructuredPoints(list(zip(px, py)))
+    unstructured_grid = fm.UnstructuredPoints(np.column_stack([px, py]))
 
     source = fm.modules.StaticSimplexNoise(
         info=fm.Info(None, grid=in_grid, units=""),
@@ -40,15 +40,8 @@ Base classes
     PlotBase
 
 """
-from . import tools
-from .colormesh import ColorMeshPlot
-from .contour import ContourPlot
-from .grid_spec import GridSpecPlot
-from .image import ImagePlot
-from .plot import PlotBase
-from .schedule import SchedulePlot
-from .time_series import StepTimeSeriesPlot, TimeSeriesPlot
-from .xy import XyPlot
+import importlib
+from typing import TYPE_CHECKING
 
 try:
     from ._version import __version__
@@ -56,6 +49,32 @@ except ModuleNotFoundError:  # pragma: no cover
     # package is not installed
     __version__ = "0.0.0.dev0"
 
+if TYPE_CHECKING:  # pragma: no cover
+    # static imports for linters and type checkers, see __getattr__ below
+    from .colormesh import ColorMeshPlot
+    from .contour import ContourPlot
+    from .grid_spec import GridSpecPlot
+    from .image import ImagePlot
+    from .plot import PlotBase
+    from .schedule import SchedulePlot
+    from .time_series import StepTimeSeriesPlot, TimeSeriesPlot
+    from .xy import XyPlot
+
+# Public names and the submodules providing them.
+# Submodules are imported on first access, so that importing the package
+# does not pull in matplotlib before a plot is actually used.
+_LAZY_IMPORTS = {
+    "ColorMeshPlot": "colormesh",
+    "ContourPlot": "contour",
+    "GridSpecPlot": "grid_spec",
+    "ImagePlot": "image",
+    "PlotBase": "plot",
+    "SchedulePlot": "schedule",
+    "StepTimeSeriesPlot": "time_series",
+    "TimeSeriesPlot": "time_series",
+    "XyPlot": "xy",
+}
+
 __all__ = [
     "ColorMeshPlot",
     "ContourPlot",
@@ -67,3 +86,20 @@ __all__ = [
     "TimeSeriesPlot",
     "PlotBase",
 ]
+
+
+def __getattr__(name):
+    if name == "tools":
+        return importlib.import_module(".tools", __name__)
+
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | {"tools"})
@@ -54,6 +54,10 @@ class ColorMeshPlot(PlotBase):
         ``float`` is interpreted as fraction of screen size.
     update_interval : int, optional
          Redraw interval, in number of push steps.
+    min_interval : float, optional
+         Minimum wall-clock time between redraws, in seconds.
+         Pushes arriving faster are skipped, but the newest one is drawn
+         when finalizing. Default ``0.0``.
     **plot_kwargs
         Keyword arguments passed to plot function. See :func:`matplotlib.pyplot.pcolormesh`.
     """
@@ -64,9 +68,10 @@ class ColorMeshPlot(PlotBase):
         pos=None,
         size=None,
         update_interval=1,
+        min_interval=0.0,
         **plot_kwargs,
     ):
-        super().__init__(title, pos, size, update_interval, **plot_kwargs)
+        super().__init__(title, pos, size, update_interval, min_interval, **plot_kwargs)
         self._time = None
         self._info = None
         self._mesh = None
@@ -103,9 +108,7 @@ class ColorMeshPlot(PlotBase):
 
     def _plot(self):
         try:
-            data = fm.data.get_magnitude(self.inputs["Grid"].pull_data(self._time))[
-                0, ...
-            ]
+            raw = self.inputs["Grid"].pull_data(self._time)
         except fm.FinamNoDataError as e:
             if self.status in (
                 fm.ComponentStatus.VALIDATED,
@@ -121,10 +124,15 @@ class ColorMeshPlot(PlotBase):
             self.axes.set_aspect("equal")
             self.figure.show()
 
-        if not self.should_repaint():
+        if self.is_same_frame(raw, self._time):
             return
 
-        self._plot_image(data)
+        if self.should_draw(raw, self._time):
+            self._draw_frame(raw, self._time)
+
+    def _draw_frame(self, data, frame_time):
+        self._time = frame_time
+        self._plot_image(fm.data.get_magnitude(data)[0, ...])
         self.repaint(relim=False)
 
     def _plot_image(self, data):
@@ -1,7 +1,9 @@
 """Components for contour plots"""
+import weakref
 from datetime import datetime
 
 import finam as fm
+import matplotlib
 import numpy as np
 from matplotlib.tri import Triangulation
 
@@ -9,6 +11,36 @@ from .plot import PlotBase
 from .tools import create_colorbar
 
 
+def _contour_kwargs():
+    """Default keyword arguments for structured contour plots"""
+    # ContourPy's "serial" algorithm is faster than the default "mpl2014",
+    # but can only be selected with matplotlib>=3.6.
+    # A user-defined "contour.algorithm" rcParam is respected.
+    if matplotlib.rcParams.get("contour.algorithm") == "mpl2014":
+        return {"algorithm": "serial"}
+    return {}
+
+
+# Triangulations by grid identity, shared by all plots of the same grid
+_TRIANGULATIONS = {}
+
+
+def _triangulation(grid, delaunay):
+    """Triangulation arguments for an unstructured grid, cached per grid object"""
+    key = (id(grid), delaunay)
+    if key not in _TRIANGULATIONS:
+        x, y = (np.ascontiguousarray(coords) for coords in grid.data_points.T[:2])
+        _TRIANGULATIONS[key] = [Triangulation(x, y)] if delaunay else [x, y, grid.cells]
+        weakref.finalize(grid, _TRIANGULATIONS.pop, key, None)
+
+    return _TRIANGULATIONS[key]
+
+
+def _all_triangles(grid):
+    """Whether all cells of an unstructured grid are triangles"""
+    return bool(np.all(np.asarray(grid.cell_types) == fm.CellType.TRI.value))
+
+
 class ContourPlot(PlotBase):
     """Contour plot component for structured and unstructured grids
 
@@ -26,6 +58,10 @@ class ContourPlot(PlotBase):
 
     Unstructured cell data with quads is currently not supported with ``fill=True``.
 
+    For structured grids, contours are generated with ContourPy's ``"serial"`` algorithm
+    if supported by matplotlib (>=3.6) and the ``contour.algorithm`` rcParam
+    is not changed. Pass ``algorithm`` to override.
+
     .. code-block:: text
 
                    +-------------+
@@ -71,6 +107,10 @@ class ContourPlot(PlotBase):
         ``float`` is interpreted as fraction of screen size.
     update_interval : int, optional
          Redraw interval, in number of push steps.
+    min_interval : float, optional
+         Minimum wall-clock time between redraws, in seconds.
+         Pushes arriving faster are skipped, but the newest one is drawn
+         when finalizing. Default ``0.0``.
     **plot_kwargs
         Keyword arguments passed to plot function. See the list of functions above.
     """
@@ -83,9 +123,10 @@ class ContourPlot(PlotBase):
         pos=None,
         size=None,
         update_interval=1,
+        min_interval=0.0,
         **plot_kwargs,
     ):
-        super().__init__(title, pos, size, update_interval, **plot_kwargs)
+        super().__init__(title, pos, size, update_interval, min_interval, **plot_kwargs)
         self._time = None
         self._triangulate = triangulate
         self._fill = fill
@@ -93,6 +134,8 @@ class ContourPlot(PlotBase):
         self._contours = None
         self._time_text = None
         self.triangulation = None
+        self._tris_only = None
+        self._plot_func = None
 
     def _initialize(self):
         self.inputs.add(
@@ -112,12 +155,17 @@ class ContourPlot(PlotBase):
         in_info = self.connector.in_infos["Grid"]
         if in_info is not None:
             self._info = in_info
+            # grid properties are fixed now, so select the plot path once
+            if isinstance(self._info.grid, fm.UnstructuredGrid):
+                self._plot_func = self._plot_unstructured
+                self._tris_only = _all_triangles(self._info.grid)
+                self.triangulation = self._create_triangulation()
+            else:
+                self._plot_func = self._plot_structured
 
     def _plot(self):
         try:
-            data = fm.data.get_magnitude(self.inputs["Grid"].pull_data(self._time))[
-                0, ...
-            ]
+            raw = self.inputs["Grid"].pull_data(self._time)
         except fm.FinamNoDataError as e:
             if self.status in (
                 fm.ComponentStatus.VALIDATED,
@@ -128,28 +176,27 @@ class ContourPlot(PlotBase):
             with fm.tools.ErrorLogger(self.logger):
                 raise e
 
-        if not self.should_repaint():
-            return
-
         if self.figure is None:
             self.create_figure()
 
             self.axes.set_aspect("equal")
-            self._time_text = self.figure.text(0.5, 0.01, self._time, ha="center")
+            self._time_text = self.figure.text(0.5, 0.01, "", ha="center")
             self.figure.show()
-        else:
-            self._time_text.set_text(self._time)
 
-        first_plot = True
-        if self._contours is not None:
-            self.axes.clear()
-            self.axes.set_title(self._title)
-            first_plot = False
+        # contour generation is expensive, don't redo it for unchanged frames
+        if self.is_same_frame(raw, self._time):
+            return
 
-        if isinstance(self._info.grid, fm.UnstructuredGrid):
-            self._plot_unstructured(data)
-        else:
-            self._plot_structured(data)
+        if self.should_draw(raw, self._time):
+            self._draw_frame(raw, self._time)
+
+    def _draw_frame(self, data, frame_time):
+        self._time = frame_time
+        self._time_text.set_text(self._time)
+
+        first_plot = self._contours is None
+
+        self._plot_func(fm.data.get_magnitude(data)[0, ...])
 
         if first_plot:
             create_colorbar(self.figure, self.axes, self._contours)
@@ -161,16 +208,20 @@ class ContourPlot(PlotBase):
         g = self._info.grid
         data = g.to_canonical(data).T
         axes = g.cell_axes if g.data_location == fm.Location.CELLS else g.axes
+        kwargs = {**_contour_kwargs(), **self.plot_kwargs}
         if self._fill:
-            self._contours = self.axes.contourf(*axes[:2], data, **self.plot_kwargs)
+            self._set_contours(self.axes.contourf(*axes[:2], data, **kwargs))
         else:
-            self._contours = self.axes.contour(*axes[:2], data, **self.plot_kwargs)
+            self._set_contours(self.axes.contour(*axes[:2], data, **kwargs))
 
     def _plot_unstructured(self, data):
         g = self._info.grid
+        # a view if data is already contiguous in grid order, a copy otherwise
+        data_flat = data.ravel(order=g.order)
+
         if g.data_location == fm.Location.POINTS:
-            needs_triangulation = isinstance(g, fm.UnstructuredPoints) or any(
-                tp != fm.CellType.TRI.value for tp in g.cell_types
+            needs_triangulation = (
+                isinstance(g, fm.UnstructuredPoints) or not self._tris_only
             )
 
             if needs_triangulation and not self._triangulate:
@@ -179,50 +230,61 @@ class ContourPlot(PlotBase):
                         "Data requires triangulation. Use with `triangulate=True`"
                     )
 
-            if self.triangulation is None:
-                if self._triangulate:
-                    self.triangulation = [Triangulation(*g.data_points.T[:2])]
-                else:
-                    self.triangulation = [
-                        *g.data_points.T[:2],
-                        g.cells,
-                    ]
-
-            data_flat = np.ascontiguousarray(data.reshape(-1, order=g.order))
             if self._fill:
-                self._contours = self.axes.tricontourf(
+                contours = self.axes.tricontourf(
                     *self.triangulation, data_flat, **self.plot_kwargs
                 )
             else:
-                self._contours = self.axes.tricontour(
+                contours = self.axes.tricontour(
                     *self.triangulation, data_flat, **self.plot_kwargs
                 )
+            self._set_contours(contours)
         else:
             if self._fill:
-                tris_only = all(tp == fm.CellType.TRI.value for tp in g.cell_types)
-
-                if not tris_only:
+                if not self._tris_only:
                     with fm.tools.ErrorLogger(self.logger):
                         raise NotImplementedError(
                             "Contour plots for cell data are only supported for triangular meshes"
                         )
 
-                data_flat = np.ascontiguousarray(data.reshape(-1, order=g.order))
-
-                self._contours = self.axes.tripcolor(
-                    *g.points.T[:2],
-                    data_flat,
-                    triangles=g.cells,
-                    **self.plot_kwargs,
+                if self._contours is None:
+                    self._contours = self.axes.tripcolor(
+                        *g.points.T[:2],
+                        data_flat,
+                        triangles=g.cells,
+                        **self.plot_kwargs,
+                    )
+                else:
+                    # fixed mesh, only the cell colors change
+                    self._contours.set_array(data_flat)
+            else:
+                self._set_contours(
+                    self.axes.tricontour(
+                        *self.triangulation, data_flat, **self.plot_kwargs
+                    )
                 )
+
+    def _set_contours(self, contours):
+        """Replaces the previous contours, keeping title, limits and colorbar."""
+        if self._contours is not None:
+            if hasattr(self._contours, "remove"):
+                self._contours.remove()
             else:
-                if self.triangulation is None:
-                    self.triangulation = [Triangulation(*g.data_points.T[:2])]
+                # contour sets are no artists before matplotlib 3.7
+                for coll in self._contours.collections:
+                    coll.remove()
+        self._contours = contours
 
-                data_flat = np.ascontiguousarray(data.reshape(-1, order=g.order))
-                self._contours = self.axes.tricontour(
-                    *self.triangulation, data_flat, **self.plot_kwargs
-                )
+    def _create_triangulation(self):
+        """Triangulation for point data and unfilled cell data, built once per grid."""
+        g = self._info.grid
+        if g.data_location == fm.Location.CELLS and self._fill:
+            # filled cell data is drawn with tripcolor from the grid's own cells
+            return None
+
+        return _triangulation(
+            g, delaunay=g.data_location == fm.Location.CELLS or self._triangulate
+        )
 
     def _data_changed(self, _caller, time):
         if time is not None and not isinstance(time, datetime):
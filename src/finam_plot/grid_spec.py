@@ -2,15 +2,42 @@
 import math
 
 import finam as fm
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
 
-from .tools import create_figure
+from .tools import create_figure, default_colors
+
+
+def _cell_edges(cells):
+    """Start and end node indices of all cell edges, as flat arrays."""
+    if isinstance(cells, np.ndarray) and cells.ndim == 2 and np.all(cells >= 0):
+        # all cells have the same number of nodes, shift them as a whole
+        return cells.ravel(), np.roll(cells, -1, axis=1).ravel()
+
+    # drop negative padding of mixed cell arrays
+    nodes = [c[c >= 0] for c in map(np.asarray, cells)]
+    counts = np.fromiter((len(n) for n in nodes), dtype=int, count=len(nodes))
+
+    starts = np.concatenate(nodes)
+    # each node connects to the next one, the last node of a cell to its first
+    ends = np.roll(starts, -1)
+    first = np.cumsum(counts) - counts
+    ends[first + counts - 1] = starts[first]
+
+    return starts, ends
+
+
+def _cell_segments(points, cells):
+    """Line segments of all cell edges, as an array of shape (n_edges, 2, 2)."""
+    starts, ends = _cell_edges(cells)
+    return np.stack((points[starts, :2], points[ends, :2]), axis=1)
 
 
 class GridSpecPlot(fm.Component):
     """Plots the geometry of grid specifications
 
-    Uses :func:`matplotlib.pyplot.plot` and :func:`matplotlib.pyplot.scatter`.
+    Uses :class:`matplotlib.collections.LineCollection` and
+    :func:`matplotlib.pyplot.scatter`.
 
     .. code-block:: text
 
@@ -61,7 +88,7 @@ class GridSpecPlot(fm.Component):
         self._figure = None
         self._names = inputs
         self._title = title
-        self._colors = colors or [e["color"] for e in plt.rcParams["axes.prop_cycle"]]
+        self._colors = colors or default_colors()
         self._bounds = (pos, size)
         self._infos = {name: None for name in self._names}
 
@@ -97,27 +124,33 @@ class GridSpecPlot(fm.Component):
         self._figure.canvas.manager.set_window_title(self._title or "FINAM")
         axes.set_title(self._title)
 
+        # inputs sharing a grid object share its edge segments
+        segments = {}
         for i, name in enumerate(self._infos):
-            self._plot_grid(axes, name, self._colors[i % len(self._colors)])
+            color = self._colors[i % len(self._colors)]
+            self._plot_grid(axes, name, color, segments)
 
         self._figure.show()
         self._figure.tight_layout()
-        self._figure.canvas.draw()
+        self._figure.canvas.draw_idle()
         self._figure.canvas.flush_events()
 
     def _finalize(self):
         pass
 
-    def _plot_grid(self, axes, name, color):
+    def _plot_grid(self, axes, name, color, segments):
         info = self._infos[name]
         data_points = info.grid.data_points
-        points = info.grid.points
-        cells = info.grid.cells
 
         if not isinstance(info.grid, fm.UnstructuredPoints):
-            self._plot_cells(axes, points, cells, color)
+            key = id(info.grid)
+            if key not in segments:
+                segments[key] = _cell_segments(info.grid.points, info.grid.cells)
+            axes.add_collection(
+                LineCollection(segments[key], colors=color, linewidths=0.5)
+            )
 
-        axes.scatter(*data_points.T[:2], marker="+", c=color)
+        axes.scatter(data_points[:, 0], data_points[:, 1], marker="+", c=color)
 
         if not isinstance(info.grid, fm.data.StructuredGrid):
             return
@@ -155,18 +188,6 @@ class GridSpecPlot(fm.Component):
             length_includes_head=True,
         )
 
-    def _plot_cells(self, axes, points, cells, color):
-        for nodes in cells:
-            for i, node in enumerate(nodes):
-                pt1 = points[node]
-                pt2 = points[nodes[(i + 1) % len(nodes)]]
-                axes.plot(
-                    [pt1[0], pt2[0]],
-                    [pt1[1], pt2[1]],
-                    c=color,
-                    lw=0.5,
-                )
-
     def _data_changed(self, _caller, _time):
         pass
         # self.update()
@@ -53,6 +53,10 @@ class ImagePlot(PlotBase):
         ``float`` is interpreted as fraction of screen size.
     update_interval : int, optional
          Redraw interval, in number of push steps.
+    min_interval : float, optional
+         Minimum wall-clock time between redraws, in seconds.
+         Pushes arriving faster are skipped, but the newest one is drawn
+         when finalizing. Default ``0.0``.
     **plot_kwargs
         Keyword arguments passed to plot function. See :func:`matplotlib.pyplot.imshow`.
     """
@@ -63,9 +67,10 @@ class ImagePlot(PlotBase):
         pos=None,
         size=None,
         update_interval=1,
+        min_interval=0.0,
         **plot_kwargs,
     ):
-        super().__init__(title, pos, size, update_interval, **plot_kwargs)
+        super().__init__(title, pos, size, update_interval, min_interval, **plot_kwargs)
         self._time = None
         self._info = None
         self._image = None
@@ -101,11 +106,21 @@ class ImagePlot(PlotBase):
                         "Only UniformGrid is supported in image plot. Try using ColorMeshPlot or ContourPlot instead."
                     )
 
+            g = self._info.grid
+            self._extent = (
+                (g.axes[0][0], g.axes[0][-1], g.axes[1][0], g.axes[1][-1])
+                if g.data_location == fm.Location.CELLS
+                else (
+                    g.axes[0][0] - g.spacing[0] / 2,
+                    g.axes[0][-1] + g.spacing[0] / 2,
+                    g.axes[1][0] - g.spacing[1] / 2,
+                    g.axes[1][-1] + g.spacing[1] / 2,
+                )
+            )
+
     def _plot(self):
         try:
-            data = fm.data.get_magnitude(self.inputs["Grid"].pull_data(self._time))[
-                0, ...
-            ]
+            raw = self.inputs["Grid"].pull_data(self._time)
         except fm.FinamNoDataError as e:
             if self.status in (
                 fm.ComponentStatus.VALIDATED,
@@ -116,26 +131,20 @@ class ImagePlot(PlotBase):
             with fm.tools.ErrorLogger(self.logger):
                 raise e
 
-        if not self.should_repaint():
-            return
-
         if self.figure is None:
             self.create_figure()
             self.axes.set_aspect("equal")
-            g = self._info.grid
-            self._extent = (
-                [g.axes[0][0], g.axes[0][-1], g.axes[1][0], g.axes[1][-1]]
-                if g.data_location == fm.Location.CELLS
-                else [
-                    g.axes[0][0] - g.spacing[0] / 2,
-                    g.axes[0][-1] + g.spacing[0] / 2,
-                    g.axes[1][0] - g.spacing[1] / 2,
-                    g.axes[1][-1] + g.spacing[1] / 2,
-                ]
-            )
             self.figure.show()
 
-        self._plot_image(data)
+        if self.is_same_frame(raw, self._time):
+            return
+
+        if self.should_draw(raw, self._time):
+            self._draw_frame(raw, self._time)
+
+    def _draw_frame(self, data, frame_time):
+        self._time = frame_time
+        self._plot_image(fm.data.get_magnitude(data)[0, ...])
         self.repaint(relim=False)
 
     def _plot_image(self, data):
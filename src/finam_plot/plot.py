@@ -1,4 +1,5 @@
 """Base classes for plots"""
+import time
 from abc import ABC
 
 import finam as fm
@@ -10,7 +11,13 @@ class PlotBase(fm.Component, ABC):
     """Base class for push-based plots"""
 
     def __init__(
-        self, title=None, pos=None, size=None, update_interval=1, **plot_kwargs
+        self,
+        title=None,
+        pos=None,
+        size=None,
+        update_interval=1,
+        min_interval=0.0,
+        **plot_kwargs,
     ):
         fm.Component.__init__(self)
         self.figure = None
@@ -20,6 +27,10 @@ class PlotBase(fm.Component, ABC):
         self._bounds = (pos, size)
         self._update_interval = update_interval
         self._update_counter = 0
+        self._min_interval = min_interval
+        self._last_repaint = None
+        self._last_frame = (None, None)
+        self._pending_frame = None
 
         self.plot_kwargs = plot_kwargs
 
@@ -30,7 +41,13 @@ class PlotBase(fm.Component, ABC):
         pass
 
     def _finalize(self):
-        pass
+        if self._pending_frame is not None:
+            data, frame_time = self._pending_frame
+            self._pending_frame = None
+            self._draw_frame(data, frame_time)
+
+    def _draw_frame(self, data, frame_time):
+        """Draws a pulled frame. Overridden by plots that use :meth:`should_draw`."""
 
     def create_figure(self):
         """Creates a figure with the plot's title and size."""
@@ -39,11 +56,44 @@ class PlotBase(fm.Component, ABC):
         self.axes.set_title(self._title)
 
     def should_repaint(self):
-        """Returns whether the plot should repaint, based on it's undate interval."""
+        """Returns whether the plot should repaint, based on it's undate interval
+        and the minimum wall-clock time between repaints."""
         rep = self._update_counter % self._update_interval == 0
         self._update_counter += 1
+
+        if rep and self._min_interval > 0:
+            now = time.monotonic()
+            if (
+                self._last_repaint is not None
+                and now - self._last_repaint < self._min_interval
+            ):
+                return False
+            self._last_repaint = now
+
         return rep
 
+    def should_draw(self, data, frame_time):
+        """Returns whether a pulled frame should be drawn now.
+
+        Uses :meth:`should_repaint`. The newest frame that is not drawn is kept,
+        and drawn when finalizing.
+        """
+        if self.should_repaint():
+            self._pending_frame = None
+            return True
+
+        self._pending_frame = (data, frame_time)
+        return False
+
+    def is_same_frame(self, data, frame_time):
+        """Returns whether data object and time are the same as in the previous call.
+
+        Used to skip redraws for repeated notifications of unchanged data.
+        """
+        last_data, last_time = self._last_frame
+        self._last_frame = (data, frame_time)
+        return data is last_data and frame_time == last_time
+
     def repaint(self, relim=False):
         """Repaints the plot window."""
         if relim:
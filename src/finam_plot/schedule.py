@@ -3,9 +3,10 @@ from datetime import datetime
 
 import finam as fm
 import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
+import numpy as np
 
 from .plot import PlotBase
+from .tools import append_value, default_colors
 
 
 class SchedulePlot(PlotBase):
@@ -60,6 +61,9 @@ class SchedulePlot(PlotBase):
         ``float`` is interpreted as fraction of screen size.
     update_interval : int, optional
          Redraw interval (independent of data retrieval).
+    min_interval : float, optional
+         Minimum wall-clock time between redraws, in seconds.
+         Data arriving in between is still recorded. Default ``0.0``.
     **plot_kwargs
         Keyword arguments passed to plot function. See :func:`matplotlib.pyplot.plot`.
     """
@@ -72,15 +76,18 @@ class SchedulePlot(PlotBase):
         pos=None,
         size=None,
         update_interval=1,
+        min_interval=0.0,
         **plot_kwargs,
     ):
-        super().__init__(title, pos, size, update_interval, **plot_kwargs)
+        super().__init__(title, pos, size, update_interval, min_interval, **plot_kwargs)
         self._time = None
         self._lines = None
-        self._x = [[] for _ in inputs]
+        self._x = [np.empty(64, dtype="datetime64[us]") for _ in inputs]
+        self._x_len = [0 for _ in inputs]
+        self._caller_index = None
 
         self._input_names = inputs
-        self._colors = colors or [e["color"] for e in plt.rcParams["axes.prop_cycle"]]
+        self._colors = colors or default_colors()
 
         if "marker" not in self.plot_kwargs:
             self.plot_kwargs["marker"] = "+"
@@ -96,6 +103,10 @@ class SchedulePlot(PlotBase):
                 fm.CallbackInput(self._data_changed, name=inp, time=None, grid=None)
             )
 
+        self._caller_index = {
+            id(self.inputs[inp]): i for i, inp in enumerate(self._input_names)
+        }
+
         self.create_connector()
 
     def _connect(self, start_time):
@@ -155,15 +166,19 @@ class SchedulePlot(PlotBase):
                 )[0]
                 for i, h in enumerate(self._input_names)
             ]
-
-        for i, inp in enumerate(self._input_names):
-            if self.inputs[inp] == caller:
-                _ = self.inputs[inp].pull_data(time)
-                self._x[i].append(time)
-
-        for i, line in enumerate(self._lines):
-            line.set_xdata(self._x[i])
-            line.set_ydata(i)
+            # the placeholder point only sets up date units, drop it
+            for i, line in enumerate(self._lines):
+                line.set_xdata(self._x[i][: self._x_len[i]])
+                line.set_ydata(np.full(self._x_len[i], i))
+
+        i = self._caller_index[id(caller)]
+        _ = caller.pull_data(time)
+        n = self._x_len[i]
+        self._x[i] = append_value(self._x[i], n, time)
+        self._x_len[i] = n + 1
+        # only the notified line has new points
+        self._lines[i].set_xdata(self._x[i][: n + 1])
+        self._lines[i].set_ydata(np.full(n + 1, i))
 
     def _finalize(self):
         """Finalize and clean up the component.
@@ -4,9 +4,13 @@ from datetime import datetime, timedelta
 import finam as fm
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
+import numpy as np
 
 from .plot import PlotBase
-from .tools import create_figure
+from .tools import append_value, create_figure, default_colors
+
+# time and value of each recorded point, in one buffer per series
+_SERIES_DTYPE = np.dtype([("x", "datetime64[us]"), ("y", np.float64)])
 
 
 class TimeSeriesPlot(PlotBase):
@@ -62,6 +66,9 @@ class TimeSeriesPlot(PlotBase):
         ``float`` is interpreted as fraction of screen size.
     update_interval : int, optional
          Redraw interval (independent of data retrieval).
+    min_interval : float, optional
+         Minimum wall-clock time between redraws, in seconds.
+         Data arriving in between is still recorded. Default ``0.0``.
     **plot_kwargs
         Keyword arguments passed to plot function. See :func:`matplotlib.pyplot.plot`.
     """
@@ -74,20 +81,22 @@ class TimeSeriesPlot(PlotBase):
         pos=None,
         size=None,
         update_interval=1,
+        min_interval=0.0,
         **plot_kwargs,
     ):
-        super().__init__(title, pos, size, update_interval, **plot_kwargs)
+        super().__init__(title, pos, size, update_interval, min_interval, **plot_kwargs)
         self._time = None
         self._caller = None
+        self._caller_index = None
 
-        self._data = [[] for _ in inputs]
-        self._x = [[] for _ in inputs]
+        self._data = [np.empty(64, dtype=_SERIES_DTYPE) for _ in inputs]
+        self._len = [0 for _ in inputs]
         self._lines = None
 
         self._input_units = (
             inputs if isinstance(inputs, dict) else {n: None for n in inputs}
         )
-        self._colors = colors or [e["color"] for e in plt.rcParams["axes.prop_cycle"]]
+        self._colors = colors or default_colors()
 
     def _initialize(self):
         """Initialize the component.
@@ -106,6 +115,10 @@ class TimeSeriesPlot(PlotBase):
                 )
             )
 
+        self._caller_index = {
+            id(self.inputs[inp]): i for i, inp in enumerate(self._input_units)
+        }
+
         self.create_connector(pull_data=self._input_units.keys())
 
     def _connect(self, start_time):
@@ -172,17 +185,22 @@ class TimeSeriesPlot(PlotBase):
                     )
                 self.axes.legend(loc=1)
 
-            for i, inp in enumerate(self._input_units):
-                if self._caller is None or self.inputs[inp] == self._caller:
-                    value = fm.data.get_magnitude(
-                        self.inputs[inp].pull_data(self._time)
-                    )
+            if self._caller is None:
+                for i, inp in enumerate(self._input_units):
+                    self._add_point(i, self.inputs[inp])
+            else:
+                self._add_point(self._caller_index[id(self._caller)], self._caller)
+
+    def _add_point(self, i, inp):
+        value = fm.data.get_magnitude(inp.pull_data(self._time))
 
-                    self._x[i].append(self._time)
-                    self._data[i].append(value.item())
+        n = self._len[i]
+        self._data[i] = append_value(self._data[i], n, (self._time, value.item()))
+        self._len[i] = n + 1
 
-                    self._lines[i].set_xdata(self._x[i])
-                    self._lines[i].set_ydata(self._data[i])
+        series = self._data[i][: n + 1]
+        self._lines[i].set_xdata(series["x"])
+        self._lines[i].set_ydata(series["y"])
 
     def _finalize(self):
         """Finalize and clean up the component.
@@ -286,8 +304,8 @@ class StepTimeSeriesPlot(fm.TimeComponent):
         self._updates = 0
         self._figure = None
         self._axes = None
-        self._data = [[] for _ in inputs]
-        self._x = [[] for _ in inputs]
+        self._data = [np.empty(64, dtype=_SERIES_DTYPE) for _ in inputs]
+        self._len = [0 for _ in inputs]
         self._lines = None
 
         self._input_units = (
@@ -296,7 +314,7 @@ class StepTimeSeriesPlot(fm.TimeComponent):
         self._title = title
         self._bounds = (pos, size)
         self._plot_kwargs = plot_kwargs
-        self._colors = colors or [e["color"] for e in plt.rcParams["axes.prop_cycle"]]
+        self._colors = colors or default_colors()
 
     @property
     def next_time(self):
@@ -367,13 +385,21 @@ class StepTimeSeriesPlot(fm.TimeComponent):
                 if self._updates % self._intervals[i] == 0:
                     value = fm.data.get_magnitude(self.inputs[inp].pull_data(self.time))
 
-                    self._x[i].append(self.time)
-                    self._data[i].append(value.item())
+                    n = self._len[i]
+                    self._data[i] = append_value(
+                        self._data[i], n, (self.time, value.item())
+                    )
+                    self._len[i] = n + 1
 
             if self._updates % self._update_interval == 0:
                 for i, line in enumerate(self._lines):
-                    line.set_xdata(self._x[i])
-                    line.set_ydata(self._data[i])
+                    n = self._len[i]
+                    # skip lines without new data since the last redraw
+                    if n == len(line.get_xdata()):
+                        continue
+                    series = self._data[i][:n]
+                    line.set_xdata(series["x"])
+                    line.set_ydata(series["y"])
                 self._repaint()
 
         self._updates += 1
@@ -1,6 +1,7 @@
 """Tool functions."""
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.cm import ScalarMappable
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
@@ -13,6 +14,23 @@ def create_colorbar(figure, axes, mappable):
     figure.colorbar(mappable, cax=cax, orientation="vertical")
 
 
+def append_value(buffer, length, value):
+    """Write a value after the first ``length`` entries of a buffer array.
+
+    Doubles the buffer capacity if it is full.
+    Returns the buffer, which is a new array if it had to grow.
+    """
+    if length == buffer.shape[0]:
+        buffer = np.concatenate((buffer, np.empty_like(buffer)))
+    buffer[length] = value
+    return buffer
+
+
+def default_colors():
+    """Colors of the current matplotlib property cycle"""
+    return [e["color"] for e in plt.rcParams["axes.prop_cycle"]]
+
+
 def create_figure(bounds):
     """Creates a figure and plot axes"""
     figure, plot_ax = plt.subplots()
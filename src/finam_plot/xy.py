@@ -1,8 +1,8 @@
 """Time series visualization."""
 import finam as fm
-import matplotlib.pyplot as plt
 
 from .plot import PlotBase
+from .tools import default_colors
 
 
 class XyPlot(PlotBase):
@@ -61,6 +61,9 @@ class XyPlot(PlotBase):
         ``float`` is interpreted as fraction of screen size.
     update_interval : int, optional
          Redraw interval (independent of data retrieval).
+    min_interval : float, optional
+         Minimum wall-clock time between redraws, in seconds.
+         Pushes arriving faster are not drawn. Default ``0.0``.
     **plot_kwargs
         Keyword arguments passed to plot function. See :func:`matplotlib.pyplot.plot`.
     """
@@ -73,17 +76,19 @@ class XyPlot(PlotBase):
         pos=None,
         size=None,
         update_interval=1,
+        min_interval=0.0,
         **plot_kwargs,
     ):
-        super().__init__(title, pos, size, update_interval, **plot_kwargs)
+        super().__init__(title, pos, size, update_interval, min_interval, **plot_kwargs)
         self._time = None
         self._caller = None
+        self._caller_index = None
 
         self._lines = None
         self._infos = None
 
         self._input_names = inputs
-        self._colors = colors or [e["color"] for e in plt.rcParams["axes.prop_cycle"]]
+        self._colors = colors or default_colors()
 
     def _initialize(self):
         """Initialize the component.
@@ -102,6 +107,10 @@ class XyPlot(PlotBase):
                 )
             )
 
+        self._caller_index = {
+            id(self.inputs[inp]): i for i, inp in enumerate(self._input_names)
+        }
+
         self.create_connector()
 
     def _connect(self, start_time):
@@ -160,14 +169,15 @@ class XyPlot(PlotBase):
             ]
             self.axes.legend(loc=1)
 
-        for i, inp in enumerate(self._input_names):
-            if self.inputs[inp] == self._caller:
-                value = self.inputs[inp].pull_data(self._time)
+        i = self._caller_index.get(id(self._caller))
+        if i is None:
+            return
 
-                x, y = self._extract_data(self._infos[inp].grid, value)
+        value = self._caller.pull_data(self._time)
+        x, y = self._extract_data(self._infos[self._input_names[i]].grid, value)
 
-                self._lines[i].set_xdata(x)
-                self._lines[i].set_ydata(y)
+        self._lines[i].set_xdata(x)
+        self._lines[i].set_ydata(y)
 
     def _extract_data(self, grid, data):
         raw = fm.data.get_magnitude(data)[0, ...]
@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime, timedelta
+from unittest import mock
 
 import finam as fm
 import numpy as np
@@ -109,3 +110,82 @@ class TestColorMesh(unittest.TestCase):
         self.assertEqual(plot._info, info_1)
 
         pyplot.close("all")
+
+    def test_colormesh_min_interval(self):
+        start = datetime(2000, 1, 1)
+        info_1 = fm.Info(
+            time=None,
+            grid=fm.RectilinearGrid(
+                [np.asarray([0.0, 1.0, 2.0]), np.asarray([0.0, 1.0, 3.0])],
+                data_location=fm.Location.CELLS,
+            ),
+            units="m",
+        )
+
+        def generate_data(t):
+            days = float((t - start).days)
+            return np.full(info_1.grid.data_shape, days) * fm.UNITS.meter
+
+        source = CallbackGenerator(
+            callbacks={"Out": (generate_data, info_1)},
+            start=start,
+            step=timedelta(days=1),
+        )
+
+        plot = ColorMeshPlot(min_interval=3600.0)
+
+        comp = fm.Composition([source, plot])
+        comp.initialize()
+
+        source.outputs["Out"] >> plot.inputs["Grid"]
+
+        with mock.patch.object(
+            plot, "_draw_frame", wraps=plot._draw_frame
+        ) as draw_frame:
+            comp.run(end_time=datetime(2000, 1, 5))
+
+        # the first frame, and the newest skipped one when finalizing
+        self.assertEqual(draw_frame.call_count, 2)
+        self.assertEqual(draw_frame.call_args[0][1], datetime(2000, 1, 5))
+        np.testing.assert_array_equal(plot._mesh.get_array(), 4.0)
+
+        pyplot.close("all")
+
+    def test_colormesh_same_frame(self):
+        info_1 = fm.Info(
+            time=None,
+            grid=fm.RectilinearGrid(
+                [np.asarray([0.0, 1.0, 2.0]), np.asarray([0.0, 1.0, 3.0])],
+                data_location=fm.Location.CELLS,
+            ),
+            units="m",
+        )
+        data = np.zeros(shape=info_1.grid.data_shape) * fm.UNITS.meter
+
+        source = CallbackGenerator(
+            callbacks={"Out": (lambda t: data.copy(), info_1)},
+            start=datetime(2000, 1, 1),
+            step=timedelta(days=1),
+        )
+
+        plot = ColorMeshPlot()
+
+        comp = fm.Composition([source, plot])
+        comp.initialize()
+
+        source.outputs["Out"] >> plot.inputs["Grid"]
+
+        comp.run(end_time=datetime(2000, 1, 2))
+
+        raw = np.ones(shape=(1, *info_1.grid.data_shape)) * fm.UNITS.meter
+        with mock.patch.object(
+            plot.inputs["Grid"], "pull_data", return_value=raw
+        ), mock.patch.object(
+            plot._mesh, "set_array", wraps=plot._mesh.set_array
+        ) as set_array:
+            plot._data_changed(None, plot._time)
+            plot._data_changed(None, plot._time)
+
+        self.assertEqual(set_array.call_count, 1)
+
+        pyplot.close("all")
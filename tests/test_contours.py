@@ -1,12 +1,14 @@
 import unittest
 from datetime import datetime, timedelta
+from unittest import mock
 
 import finam as fm
+import matplotlib
 import numpy as np
 from matplotlib import pyplot
 from matplotlib.tri import Triangulation
 
-from finam_plot.contour import ContourPlot
+from finam_plot.contour import ContourPlot, _contour_kwargs
 
 
 class TestContour(unittest.TestCase):
@@ -271,3 +273,90 @@ class TestContour(unittest.TestCase):
         self.assertEqual(plot._info, info_1)
 
         pyplot.close("all")
+
+    def test_contour_shared_triangulation(self):
+        points = 100
+        info_1 = fm.Info(
+            time=None,
+            grid=fm.UnstructuredPoints(
+                np.random.uniform(0, 100, 2 * points).reshape((points, 2))
+            ),
+            units="m",
+        )
+        grid = np.arange(points, dtype=np.float64) * fm.UNITS.meter
+
+        source = fm.modules.CallbackGenerator(
+            callbacks={"Out": (lambda t: grid.copy(), info_1)},
+            start=datetime(2000, 1, 1),
+            step=timedelta(days=1),
+        )
+
+        plot_1 = ContourPlot(triangulate=True)
+        plot_2 = ContourPlot(fill=False, triangulate=True)
+
+        comp = fm.Composition([source, plot_1, plot_2])
+        comp.initialize()
+
+        source.outputs["Out"] >> plot_1.inputs["Grid"]
+        source.outputs["Out"] >> plot_2.inputs["Grid"]
+
+        comp.run(end_time=datetime(2000, 1, 2))
+
+        self.assertIsInstance(plot_1.triangulation[0], Triangulation)
+        self.assertIs(plot_1.triangulation, plot_2.triangulation)
+
+        pyplot.close("all")
+
+    def test_contour_same_frame(self):
+        info_1 = fm.Info(
+            time=None,
+            grid=fm.UniformGrid(dims=(4, 3), data_location=fm.Location.POINTS),
+            units="m",
+        )
+        data = (
+            np.arange(info_1.grid.data_size, dtype=np.float64).reshape(
+                info_1.grid.data_shape
+            )
+            * fm.UNITS.meter
+        )
+
+        source = fm.modules.CallbackGenerator(
+            callbacks={"Out": (lambda t: data.copy(), info_1)},
+            start=datetime(2000, 1, 1),
+            step=timedelta(days=1),
+        )
+
+        plot = ContourPlot()
+
+        comp = fm.Composition([source, plot])
+        comp.initialize()
+
+        source.outputs["Out"] >> plot.inputs["Grid"]
+
+        comp.run(end_time=datetime(2000, 1, 2))
+
+        raw = (
+            np.arange(info_1.grid.data_size, dtype=np.float64).reshape(
+                (1, *info_1.grid.data_shape)
+            )
+            * fm.UNITS.meter
+        )
+        with mock.patch.object(
+            plot.inputs["Grid"], "pull_data", return_value=raw
+        ), mock.patch.object(plot, "_plot_func", wraps=plot._plot_func) as plot_func:
+            plot._data_changed(None, plot._time)
+            plot._data_changed(None, plot._time)
+
+        self.assertEqual(plot_func.call_count, 1)
+
+        pyplot.close("all")
+
+    def test_contour_algorithm(self):
+        if "contour.algorithm" not in matplotlib.rcParams:
+            self.assertEqual(_contour_kwargs(), {})
+            return
+
+        with matplotlib.rc_context({"contour.algorithm": "mpl2014"}):
+            self.assertEqual(_contour_kwargs(), {"algorithm": "serial"})
+        with matplotlib.rc_context({"contour.algorithm": "threaded"}):
+            self.assertEqual(_contour_kwargs(), {})
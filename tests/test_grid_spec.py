@@ -4,8 +4,9 @@ from datetime import datetime, timedelta
 import finam as fm
 import numpy as np
 from matplotlib import pyplot
+from matplotlib.collections import LineCollection
 
-from finam_plot.grid_spec import GridSpecPlot
+from finam_plot.grid_spec import GridSpecPlot, _cell_edges
 
 
 class TestGridSpec(unittest.TestCase):
@@ -53,3 +54,54 @@ class TestGridSpec(unittest.TestCase):
         self.assertEqual(plot._infos, {"In1": info_1, "In2": info_2})
 
         pyplot.close("all")
+
+    def test_grid_spec_unstructured(self):
+        points = [[0, 0], [0, 1], [1, 0], [1, 1]]
+        cells = [[0, 1, 2], [1, 2, 3]]
+        info_1 = fm.Info(
+            time=None,
+            grid=fm.UnstructuredGrid(
+                points=points,
+                cells=cells,
+                cell_types=[fm.CellType.TRI.value] * len(cells),
+                data_location=fm.Location.POINTS,
+            ),
+            units="m",
+        )
+        grid_1 = np.zeros(shape=(len(points),)) * fm.UNITS.meter
+
+        source = fm.modules.CallbackGenerator(
+            callbacks={"Out1": (lambda t: grid_1.copy(), info_1)},
+            start=datetime(2000, 1, 1),
+            step=timedelta(days=1),
+        )
+
+        plot = GridSpecPlot(["In1"])
+
+        comp = fm.Composition([source, plot])
+        comp.initialize()
+
+        source.outputs["Out1"] >> plot.inputs["In1"]
+
+        comp.run(end_time=datetime(2000, 1, 2))
+
+        edges = [
+            c for c in plot._figure.axes[0].collections if isinstance(c, LineCollection)
+        ]
+        self.assertEqual(len(edges), 1)
+
+        pyplot.close("all")
+
+    def test_cell_edges(self):
+        cells = [[0, 1, 2], [1, 2, 3]]
+        starts, ends = _cell_edges(np.array(cells))
+        np.testing.assert_array_equal(starts, [0, 1, 2, 1, 2, 3])
+        np.testing.assert_array_equal(ends, [1, 2, 0, 2, 3, 1])
+
+        starts, ends = _cell_edges([[0, 1, 2], [1, 2, 3, 4]])
+        np.testing.assert_array_equal(starts, [0, 1, 2, 1, 2, 3, 4])
+        np.testing.assert_array_equal(ends, [1, 2, 0, 2, 3, 4, 1])
+
+        starts, ends = _cell_edges(np.array([[0, 1, 2, -1], [1, 2, 3, 4]]))
+        np.testing.assert_array_equal(starts, [0, 1, 2, 1, 2, 3, 4])
+        np.testing.assert_array_equal(ends, [1, 2, 0, 2, 3, 4, 1])
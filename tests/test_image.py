@@ -1,5 +1,6 @@
 import unittest
 from datetime import datetime, timedelta
+from unittest import mock
 
 import finam as fm
 import numpy as np
@@ -103,3 +104,39 @@ class TestImage(unittest.TestCase):
         self.assertEqual(plot._info, info_1)
 
         pyplot.close("all")
+
+    def test_image_same_frame(self):
+        info_1 = fm.Info(
+            time=None,
+            grid=fm.UniformGrid(dims=(4, 3), data_location=fm.Location.POINTS),
+            units="m",
+        )
+        data = np.zeros(shape=info_1.grid.data_shape) * fm.UNITS.meter
+
+        source = CallbackGenerator(
+            callbacks={"Out": (lambda t: data.copy(), info_1)},
+            start=datetime(2000, 1, 1),
+            step=timedelta(days=1),
+        )
+
+        plot = ImagePlot()
+
+        comp = fm.Composition([source, plot])
+        comp.initialize()
+
+        source.outputs["Out"] >> plot.inputs["Grid"]
+
+        comp.run(end_time=datetime(2000, 1, 2))
+
+        raw = np.ones(shape=(1, *info_1.grid.data_shape)) * fm.UNITS.meter
+        with mock.patch.object(
+            plot.inputs["Grid"], "pull_data", return_value=raw
+        ), mock.patch.object(
+            plot._image, "set_data", wraps=plot._image.set_data
+        ) as set_data:
+            plot._data_changed(None, plot._time)
+            plot._data_changed(None, plot._time)
+
+        self.assertEqual(set_data.call_count, 1)
+
+        pyplot.close("all")
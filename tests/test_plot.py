@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime, timedelta
+
+from finam_plot.plot import PlotBase
+
+
+class FramePlot(PlotBase):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.frames = []
+
+    def _initialize(self):
+        pass
+
+    def _connect(self, start_time):
+        pass
+
+    def _draw_frame(self, data, frame_time):
+        self.frames.append((data, frame_time))
+
+
+class TestPlotBase(unittest.TestCase):
+    def test_update_interval(self):
+        plot = FramePlot(update_interval=2)
+
+        self.assertTrue(plot.should_repaint())
+        self.assertFalse(plot.should_repaint())
+        self.assertTrue(plot.should_repaint())
+
+    def test_min_interval(self):
+        plot = FramePlot(min_interval=3600.0)
+        time = datetime(2000, 1, 1)
+        frames = [(object(), time + timedelta(days=i)) for i in range(3)]
+
+        self.assertTrue(plot.should_draw(*frames[0]))
+        self.assertFalse(plot.should_draw(*frames[1]))
+        self.assertFalse(plot.should_draw(*frames[2]))
+
+        plot._finalize()
+        self.assertEqual(plot.frames, [frames[2]])
+
+        # nothing is pending after finalizing
+        plot._finalize()
+        self.assertEqual(plot.frames, [frames[2]])
+
+    def test_same_frame(self):
+        plot = FramePlot()
+        time = datetime(2000, 1, 1)
+        data = object()
+
+        self.assertFalse(plot.is_same_frame(data, time))
+        self.assertTrue(plot.is_same_frame(data, time))
+        self.assertFalse(plot.is_same_frame(object(), time))
+        self.assertFalse(plot.is_same_frame(data, time + timedelta(days=1)))
@@ -0,0 +1,30 @@
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from finam_plot.tools import append_value
+
+
+class TestTools(unittest.TestCase):
+    def test_append_value(self):
+        buffer = np.empty(2, dtype=np.float64)
+        for i in range(5):
+            buffer = append_value(buffer, i, float(i))
+
+        self.assertEqual(buffer.shape, (8,))
+        np.testing.assert_array_equal(buffer[:5], [0.0, 1.0, 2.0, 3.0, 4.0])
+
+    def test_append_value_keeps_views(self):
+        start = datetime(2000, 1, 1)
+        buffer = np.empty(2, dtype="datetime64[us]")
+        buffer = append_value(buffer, 0, start)
+        buffer = append_value(buffer, 1, start + timedelta(days=1))
+        view = buffer[:2]
+
+        grown = append_value(buffer, 2, start + timedelta(days=2))
+
+        self.assertIsNot(grown, buffer)
+        self.assertEqual(grown.shape, (4,))
+        np.testing.assert_array_equal(grown[:2], view)
+        self.assertEqual(grown[2], np.datetime64(start + timedelta(days=2), "us"))